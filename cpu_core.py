@@ -3,14 +3,28 @@ import time
 from datetime import datetime
 import logging
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from collections import deque
 from threading import Thread, Lock, Event
-import queue
+from concurrent.futures import ThreadPoolExecutor
 import sys
-import traceback
 import os
 
-@dataclass
+# Python 3.10+ 支持slots，去掉实例__dict__以减小内存占用
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Linux下直接解析/proc/<pid>/stat，绕过psutil的多次读取
+_IS_LINUX = sys.platform.startswith('linux')
+if _IS_LINUX:
+    _CLK_TCK = os.sysconf('SC_CLK_TCK')
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+def get_log_level() -> int:
+    """从环境变量CPU_MONITOR_LOGLEVEL读取日志级别，默认INFO"""
+    level = getattr(logging, os.environ.get('CPU_MONITOR_LOGLEVEL', 'INFO').upper(), None)
+    return level if isinstance(level, int) else logging.INFO
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessInfo:
     name: str
     pid: int
@@ -40,22 +54,39 @@ class CPUMonitorCore:
             'cpu_stats': {},
             'memory_stats': {}
         }
+        self.history_max_points = 100
+        
+        # CPU频率变化缓慢，缓存读取结果 (freq, monotonic timestamp)
+        self._cpu_freq_cache = (0, float('-inf'))
+        self.cpu_freq_refresh_interval = 5  # 秒
+        # 定长队列，追加时自动淘汰最旧的数据点
         self.history_data = {
-            'cpu': [],
-            'memory': [],
-            'timestamps': []
+            'cpu': deque(maxlen=self.history_max_points),
+            'memory': deque(maxlen=self.history_max_points),
+            'timestamps': deque(maxlen=self.history_max_points)
         }
-        self.history_max_points = 100
-        self.update_queue = queue.Queue()
+        # 最新样本 (序号, CPU%, 内存%)，整体替换发布，供UI逐点追加
+        self._latest_sample = (0, 0.0, 0.0)
+        self.update_notifier = Event()  # 完整更新完成后置位，由消费者清除
         
         # 进程CPU使用历史记录
-        self.process_cpu_history = {}  # {pid: [(timestamp, cpu_percent), ...]}
+        # {pid: {'samples': deque[(timestamp, cpu_centi)], 'total': int}}，CPU按0.01%定点整数存储，增减无浮点误差
+        self.process_cpu_history = {}
         self.history_window = 180  # 3分钟 = 180秒
+        # 每个进程最多保留的样本数（按最小更新间隔0.5秒计算）
+        self.history_max_samples = int(self.history_window / 0.5)
         
         # 进程缓存，减少重复获取
         self.process_cache = {}
         self.cache_ttl = 5  # 缓存有效期（秒）
-        self.last_cache_cleanup = time.time()
+        self.idle_cache_ttl = 30  # 空闲进程缓存有效期（秒）
+        self.idle_cpu_threshold = 0.1  # 低于此CPU使用率视为空闲
+        self.last_cache_cleanup = time.monotonic()
+        
+        # 跨周期复用的Process对象 {pid: psutil.Process}
+        self._proc_objs: Dict[int, psutil.Process] = {}
+        # Linux快速路径的上次采样 {pid: (utime+stime ticks, timestamp, starttime)}
+        self._stat_samples: Dict[int, Tuple[int, float, int]] = {}
         
         # 验证系统访问权限
         self._verify_system_access()
@@ -63,6 +94,9 @@ class CPUMonitorCore:
         # 预热系统，确保进程信息可用
         self._warmup_system()
         
+        # 并行获取进程详细信息（主要耗时在系统调用，期间释放GIL）
+        self._executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        
         self._start_monitor_thread()
         logging.info("CPUMonitorCore initialized successfully")
 
@@ -89,8 +123,9 @@ class CPUMonitorCore:
     def _warmup_system(self):
         """预热系统，确保进程信息可用"""
         try:
-            # 预热CPU百分比计算
-            psutil.cpu_percent(interval=0.1)
+            # 预热CPU百分比计算（非阻塞，后续调用返回与上次调用之间的差值）
+            psutil.cpu_percent(interval=None)
+            psutil.cpu_times_percent(interval=None)
             
             # 获取所有进程列表，预热进程信息
             process_count = 0
@@ -104,7 +139,7 @@ class CPUMonitorCore:
     def _setup_logging(self):
         """设置日志记录"""
         logging.basicConfig(
-            level=logging.DEBUG,
+            level=get_log_level(),
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
                 logging.FileHandler('cpu_monitor_core.log'),
@@ -112,114 +147,141 @@ class CPUMonitorCore:
             ]
         )
 
+    def _trim_cpu_history(self, entry: Dict, cutoff_time: float):
+        """从左侧弹出过期样本，同时维护累计值"""
+        samples = entry['samples']
+        while samples and samples[0][0] < cutoff_time:
+            entry['total'] -= samples.popleft()[1]
+
     def _cleanup_process_history(self):
         """清理过期的进程CPU使用历史记录"""
-        current_time = time.time()
+        current_time = time.monotonic()
         cutoff_time = current_time - self.history_window
         
         with self.data_lock:
-            # 清理过期数据
+            # 清理过期数据，删除已无样本的进程
             for pid in list(self.process_cpu_history.keys()):
-                history = self.process_cpu_history[pid]
-                # 保留最近3分钟的数据
-                history = [(t, c) for t, c in history if t >= cutoff_time]
-                if history:
-                    self.process_cpu_history[pid] = history
-                else:
+                entry = self.process_cpu_history[pid]
+                self._trim_cpu_history(entry, cutoff_time)
+                if not entry['samples']:
                     del self.process_cpu_history[pid]
 
-    def _update_process_cpu_history(self, pid: int, cpu_percent: float):
-        """更新进程CPU使用历史"""
-        current_time = time.time()
-        with self.data_lock:
-            if pid not in self.process_cpu_history:
-                self.process_cpu_history[pid] = []
-            self.process_cpu_history[pid].append((current_time, cpu_percent))
-
-    def _calculate_average_cpu(self, pid: int) -> float:
-        """计算进程的3分钟平均CPU使用率"""
+    def _record_and_avg(self, pid: int, cpu_percent: float) -> float:
+        """记录进程CPU使用率并返回3分钟平均值（单次加锁）"""
+        current_time = time.monotonic()
         with self.data_lock:
-            if pid not in self.process_cpu_history:
-                return 0.0
+            entry = self.process_cpu_history.get(pid)
+            if entry is None:
+                entry = {'samples': deque(maxlen=self.history_max_samples), 'total': 0}
+                self.process_cpu_history[pid] = entry
             
-            history = self.process_cpu_history[pid]
-            current_time = time.time()
-            cutoff_time = current_time - self.history_window
+            samples = entry['samples']
+            # deque满时append会丢弃最左侧样本，先从累计值中扣除
+            if len(samples) == samples.maxlen:
+                entry['total'] -= samples.popleft()[1]
+            cpu_centi = round(cpu_percent * 100)
+            samples.append((current_time, cpu_centi))
+            entry['total'] += cpu_centi
+            self._trim_cpu_history(entry, current_time - self.history_window)
             
-            # 只计算最近3分钟的数据
-            recent_history = [(t, c) for t, c in history if t >= cutoff_time]
-            if not recent_history:
-                return 0.0
-            
-            total_cpu = sum(cpu for _, cpu in recent_history)
-            return total_cpu / len(recent_history)
+            return entry['total'] / len(samples) / 100
 
-    def _get_process_info(self, process: psutil.Process) -> Optional[ProcessInfo]:
-        """获取进程信息（优化版本）"""
+    def _get_process_info(self, process: psutil.Process, cpu_percent: Optional[float] = None,
+                          memory_percent: Optional[float] = None) -> Optional[ProcessInfo]:
+        """获取进程信息（优化版本），cpu_percent/memory_percent为调用方已采样的值时不再重复采样"""
         pid = process.pid
         
         # 检查缓存
-        current_time = time.time()
-        if pid in self.process_cache:
-            cache_entry = self.process_cache[pid]
-            # 如果缓存未过期，直接返回
-            if current_time - cache_entry['timestamp'] < self.cache_ttl:
-                # 仅更新CPU和内存使用率
-                try:
-                    cpu_percent = process.cpu_percent()
-                    cache_entry['info'].cpu_percent = cpu_percent
-                    cache_entry['info'].memory_percent = process.memory_percent()
-                    cache_entry['info'].status = "HIGH" if cpu_percent > self.threshold else "Normal"
-                    # 更新CPU历史并计算平均值
-                    self._update_process_cpu_history(pid, cpu_percent)
-                    cache_entry['info'].avg_cpu_percent = self._calculate_average_cpu(pid)
-                    return cache_entry['info']
-                except:
-                    # 如果更新失败，删除缓存
-                    del self.process_cache[pid]
+        current_time = time.monotonic()
+        cache_entry = self.process_cache.get(pid)
+        # 如果缓存未过期，仅刷新动态字段
+        if cache_entry is not None and current_time - cache_entry['timestamp'] < self.cache_ttl:
+            try:
+                info = self._refresh_process(process, cache_entry['info'], cpu_percent, memory_percent)
+                cache_entry['info'] = info
+                return info
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                # 如果更新失败，删除缓存
+                self.process_cache.pop(pid, None)
         
         # 缓存未命中，获取完整信息
+        return self._full_process(process, cpu_percent, memory_percent, current_time)
+
+    def _refresh_process(self, process: psutil.Process, info: ProcessInfo,
+                         cpu_percent: Optional[float] = None,
+                         memory_percent: Optional[float] = None) -> ProcessInfo:
+        """缓存命中时仅更新CPU和内存使用率，返回新对象，已发布的对象保持不变"""
+        if cpu_percent is None:
+            with process.oneshot():
+                cpu_percent = process.cpu_percent()
+                memory_percent = process.memory_percent()
+        elif memory_percent is None:
+            # 只剩单个属性，无需oneshot
+            memory_percent = process.memory_percent()
+        
+        # 更新CPU历史并计算平均值
+        return replace(info,
+                       cpu_percent=cpu_percent,
+                       memory_percent=memory_percent,
+                       status="HIGH" if cpu_percent > self.threshold else "Normal",
+                       avg_cpu_percent=self._record_and_avg(process.pid, cpu_percent))
+
+    def _full_process(self, process: psutil.Process, cpu_percent: Optional[float],
+                      memory_percent: Optional[float], current_time: float) -> Optional[ProcessInfo]:
+        """首次发现或缓存过期时获取完整进程信息"""
+        pid = process.pid
         try:
             # 使用oneshot减少系统调用
             with process.oneshot():
                 try:
-                    # 基本信息
-                    name = process.name()
+                    # 创建时间（Process对象初始化时已缓存）
+                    try:
+                        create_time = process.create_time()
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
+                        create_time = 0
                     
-                    # CPU和内存使用
-                    cpu_percent = process.cpu_percent()
-                    memory_percent = process.memory_percent()
+                    # 名称、用户、命令行在进程生命周期内不变，复用旧缓存（即使已过期）；
+                    # PID复用在采样阶段检测并清除缓存，这里的创建时间比较只作兜底
+                    cache_entry = self.process_cache.get(pid)
+                    known = cache_entry['info'] if cache_entry is not None else None
+                    if known is not None and create_time and known.create_time == create_time and known.status != "N/A":
+                        name = known.name
+                        username = known.username
+                        command = known.command
+                    else:
+                        # 基本信息
+                        name = process.name()
+                        
+                        # 用户信息 - 可能耗时，简化处理
+                        try:
+                            username = process.username()
+                        except (psutil.AccessDenied, psutil.ZombieProcess):
+                            username = "N/A"
+                        
+                        # 命令行 - 可能耗时，简化处理
+                        try:
+                            cmdline = process.cmdline()
+                            # 空命令行多为内核线程，exe()同样无法获取，直接使用进程名
+                            command = ' '.join(cmdline) if cmdline else name
+                        except (psutil.AccessDenied, psutil.ZombieProcess):
+                            command = name
                     
-                    # 更新CPU历史
-                    self._update_process_cpu_history(pid, cpu_percent)
-                    avg_cpu_percent = self._calculate_average_cpu(pid)
+                    # CPU和内存使用
+                    if cpu_percent is None:
+                        cpu_percent = process.cpu_percent()
+                    if memory_percent is None:
+                        memory_percent = process.memory_percent()
                     
-                    # 用户信息 - 可能耗时，简化处理
-                    try:
-                        username = process.username()
-                    except:
-                        username = "N/A"
+                    # 更新CPU历史并计算平均值
+                    avg_cpu_percent = self._record_and_avg(pid, cpu_percent)
                     
                     # 状态
                     status = "HIGH" if cpu_percent > self.threshold else "Normal"
                     
-                    # 命令行 - 可能耗时，简化处理
-                    try:
-                        cmdline = process.cmdline()
-                        command = ' '.join(cmdline) if cmdline else process.exe()
-                    except:
-                        command = name
-                    
-                    # 创建时间
-                    try:
-                        create_time = process.create_time()
-                    except:
-                        create_time = 0
-                    
                     # 线程数
                     try:
                         threads = process.num_threads()
-                    except:
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
                         threads = 0
 
                     # 创建进程信息对象
@@ -246,8 +308,7 @@ class CPUMonitorCore:
                     
                 except psutil.NoSuchProcess:
                     # 进程不存在，从缓存中删除
-                    if pid in self.process_cache:
-                        del self.process_cache[pid]
+                    self.process_cache.pop(pid, None)
                     return None
                 except psutil.AccessDenied:
                     # 对于无法访问的进程，使用有限信息
@@ -271,76 +332,161 @@ class CPUMonitorCore:
                         }
                         
                         return info
-                    except:
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
                         return None
                 except Exception as e:
-                    logging.debug(f"Error getting process info: {str(e)}")
+                    logging.debug("Error getting process info: %s", e)
                     return None
         except Exception as e:
-            logging.debug(f"Error in process oneshot context: {str(e)}")
+            logging.debug("Error in process oneshot context: %s", e)
             return None
     
+    def _forget_pid(self, pid: int):
+        """进程退出或PID被新进程复用时，丢弃属于旧进程的采样状态、缓存和CPU历史"""
+        self._proc_objs.pop(pid, None)
+        self._stat_samples.pop(pid, None)
+        self.process_cache.pop(pid, None)
+        with self.data_lock:
+            self.process_cpu_history.pop(pid, None)
+
     def _cleanup_process_cache(self):
         """清理过期的进程缓存"""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_cache_cleanup > 30:  # 每30秒清理一次
+            # 空闲进程缓存可保留更久，按较长的有效期清理
+            max_ttl = max(self.cache_ttl, self.idle_cache_ttl)
             expired_pids = []
-            for pid, cache_entry in self.process_cache.items():
-                if current_time - cache_entry['timestamp'] > self.cache_ttl:
+            # 遍历快照，避免其他线程（如kill_process）修改字典时出错
+            for pid, cache_entry in list(self.process_cache.items()):
+                if current_time - cache_entry['timestamp'] > max_ttl:
                     expired_pids.append(pid)
             
             for pid in expired_pids:
-                del self.process_cache[pid]
+                self.process_cache.pop(pid, None)
                 
             self.last_cache_cleanup = current_time
-            logging.debug(f"Cache cleanup: removed {len(expired_pids)} expired entries")
+            logging.debug("Cache cleanup: removed %d expired entries", len(expired_pids))
+
+    def _get_cpu_freq(self) -> float:
+        """获取CPU频率，每隔cpu_freq_refresh_interval秒才重新读取"""
+        freq, timestamp = self._cpu_freq_cache
+        current_time = time.monotonic()
+        if current_time - timestamp > self.cpu_freq_refresh_interval:
+            cpu_freq = psutil.cpu_freq()
+            freq = cpu_freq.current if cpu_freq else 0
+            self._cpu_freq_cache = (freq, current_time)
+        return freq
 
     def _update_system_stats(self):
         """更新系统统计信息"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
-            cpu_freq = psutil.cpu_freq()
+            cpu_freq = self._get_cpu_freq()
+            cpu_times = psutil.cpu_times_percent(interval=None)
+            
+            # 写时复制：构建新对象后整体替换引用，读取方无需加锁
+            self.system_data = {
+                'cpu_percent': cpu_percent,
+                'memory_percent': memory.percent,
+                'cpu_freq': cpu_freq,
+                'cpu_count': self.system_data['cpu_count'],
+                'cpu_stats': {
+                    'user': cpu_times.user,
+                    'system': cpu_times.system,
+                    'idle': cpu_times.idle
+                },
+                'memory_stats': {
+                    'total': memory.total,
+                    'available': memory.available,
+                    'used': memory.used
+                }
+            }
             
+            # Update history（原地追加，需与读取方互斥）
             with self.data_lock:
-                self.system_data.update({
-                    'cpu_percent': cpu_percent,
-                    'memory_percent': memory.percent,
-                    'cpu_freq': cpu_freq.current if cpu_freq else 0,
-                    'cpu_stats': {
-                        'user': psutil.cpu_times_percent().user,
-                        'system': psutil.cpu_times_percent().system,
-                        'idle': psutil.cpu_times_percent().idle
-                    },
-                    'memory_stats': {
-                        'total': memory.total,
-                        'available': memory.available,
-                        'used': memory.used
-                    }
-                })
-                
-                # Update history
                 self.history_data['cpu'].append(cpu_percent)
                 self.history_data['memory'].append(memory.percent)
                 self.history_data['timestamps'].append(datetime.now())
-                
-                # Keep only last N points
-                if len(self.history_data['cpu']) > self.history_max_points:
-                    self.history_data['cpu'] = self.history_data['cpu'][-self.history_max_points:]
-                    self.history_data['memory'] = self.history_data['memory'][-self.history_max_points:]
-                    self.history_data['timestamps'] = self.history_data['timestamps'][-self.history_max_points:]
+                self._latest_sample = (self._latest_sample[0] + 1, cpu_percent, memory.percent)
             
-            logging.debug(f"System stats updated - CPU: {cpu_percent}%, Memory: {memory.percent}%")
+            logging.debug("System stats updated - CPU: %s%%, Memory: %s%%", cpu_percent, memory.percent)
         except Exception as e:
-            logging.error(f"Error updating system stats: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.error(f"Error updating system stats: {str(e)}", exc_info=True)
+
+    def _fast_refresh_linux(self, pid: int, current_time: float) -> Tuple[Optional[float], int]:
+        """解析/proc/<pid>/stat获取CPU使用率和常驻内存字节数（仅Linux），尚无基准时CPU为None"""
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            data = f.read()
+        # 进程名可能包含空格或括号，从最后一个')'之后按字段切分
+        fields = data[data.rindex(b')') + 2:].split()
+        ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        start_time = int(fields[19])
+        rss = int(fields[21]) * _PAGE_SIZE
+        
+        prev = self._stat_samples.get(pid)
+        if prev is not None and prev[2] != start_time:
+            self._forget_pid(pid)
+            prev = None
+        self._stat_samples[pid] = (ticks, current_time, start_time)
+        if prev is None or current_time <= prev[1]:
+            # 首次出现或PID被复用，尚无可比较的基准
+            return None, rss
+        
+        # 与psutil.Process.cpu_percent口径一致：单进程可超过100%
+        cpu_percent = (ticks - prev[0]) / _CLK_TCK / (current_time - prev[1]) * 100
+        return max(cpu_percent, 0.0), rss
+
+    def _sample_processes(self) -> List[Tuple[float, int, Optional[float], bool]]:
+        """采样所有进程的CPU使用率，返回[(cpu_percent, pid, memory_percent, has_baseline), ...]
+
+        has_baseline为False表示首次采样，cpu_percent按psutil惯例记为0.0
+        """
+        samples = []
+        if _IS_LINUX:
+            total_memory = self.system_data['memory_stats'].get('total') or psutil.virtual_memory().total
+            current_time = time.monotonic()
+            for pid in psutil.pids():
+                try:
+                    cpu_percent, rss = self._fast_refresh_linux(pid, current_time)
+                except (OSError, ValueError, IndexError):
+                    # 进程已退出或无法读取
+                    self._stat_samples.pop(pid, None)
+                    continue
+                if cpu_percent is None:
+                    samples.append((0.0, pid, rss * 100.0 / total_memory, False))
+                else:
+                    samples.append((cpu_percent, pid, rss * 100.0 / total_memory, True))
+        else:
+            # 直接遍历PID并复用Process对象，避免process_iter的额外检查
+            for pid in psutil.pids():
+                proc = self._proc_objs.get(pid)
+                try:
+                    has_baseline = proc is not None
+                    if proc is None:
+                        proc = psutil.Process(pid)
+                        self._proc_objs[pid] = proc
+                    samples.append((proc.cpu_percent(), pid, None, has_baseline))
+                except psutil.NoSuchProcess:
+                    self._proc_objs.pop(pid, None)
+                except psutil.Error:
+                    continue
+        
+        # 移除已退出进程的采样状态、缓存和CPU历史，PID之后被复用时不会沿用旧进程的信息
+        live_pids = {sample[1] for sample in samples}
+        dead_pids = ({*self._proc_objs, *self._stat_samples, *self.process_cache,
+                      *self.process_cpu_history} - live_pids)
+        for pid in dead_pids:
+            self._forget_pid(pid)
+        
+        return samples
 
     def _monitor_loop(self):
         """监控循环"""
-        last_full_update = 0
+        last_full_update = float('-inf')
         while self.running:
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 # 更新系统统计信息
                 self._update_system_stats()
@@ -362,57 +508,77 @@ class CPUMonitorCore:
                     
                     # 获取进程列表
                     try:
-                        # 限制获取的进程数量，提高性能
-                        process_iter = list(psutil.process_iter(['pid', 'name', 'cpu_percent']))
+                        candidates = self._sample_processes()
                         
                         # 按CPU使用率预排序，只处理前100个进程
-                        process_iter.sort(key=lambda p: p.info['cpu_percent'] if p.info['cpu_percent'] is not None else 0, reverse=True)
-                        process_iter = process_iter[:100]
+                        candidates.sort(key=lambda c: c[0], reverse=True)
                         
                         # 获取详细信息
-                        for proc in process_iter:
-                            info = self._get_process_info(proc)
-                            if info:
+                        to_fetch = []
+                        for cpu_percent, pid, memory_percent, has_baseline in candidates[:100]:
+                            if not _IS_LINUX and has_baseline:
+                                # 非Linux采样未检查PID复用（逐个检查需为每个PID新建Process），
+                                # 只对需要取详情的候选进程检查创建时间，本轮预排序可能短暂失准
+                                proc = self._proc_objs.get(pid)
+                                if proc is not None and not proc.is_running():
+                                    self._forget_pid(pid)
+                                    has_baseline = False
+                            
+                            if not has_baseline:
+                                # 首次采样的PID不会有属于自己的缓存，残留项来自之前使用该PID的进程
+                                self.process_cache.pop(pid, None)
+                                with self.data_lock:
+                                    self.process_cpu_history.pop(pid, None)
+                            
+                            # 空闲进程直接复用缓存，不再访问进程；首次采样的0.0不代表空闲
+                            cache_entry = self.process_cache.get(pid)
+                            if (has_baseline
+                                    and cache_entry is not None
+                                    and cpu_percent < self.idle_cpu_threshold
+                                    and current_time - cache_entry['timestamp'] < self.idle_cache_ttl):
+                                # 构建新对象，上一轮已发布的对象可能正被UI线程读取
+                                info = cache_entry['info']
+                                info = replace(info,
+                                               cpu_percent=cpu_percent,
+                                               memory_percent=(info.memory_percent if memory_percent is None
+                                                               else memory_percent),
+                                               status="HIGH" if cpu_percent > self.threshold else "Normal",
+                                               avg_cpu_percent=self._record_and_avg(pid, cpu_percent))
+                                cache_entry['info'] = info
                                 processes.append(info)
-                    except Exception as e:
-                        logging.error(f"Error getting process list: {str(e)}")
-                    
-                    # 如果没有获取到进程，尝试备用方法
-                    if not processes:
-                        logging.warning("No processes found with standard method, trying alternative approach")
-                        try:
-                            for pid in psutil.pids()[:100]:  # 限制处理的进程数量
+                                continue
+                            
+                            proc = self._proc_objs.get(pid)
+                            if proc is None:
                                 try:
                                     proc = psutil.Process(pid)
-                                    info = self._get_process_info(proc)
-                                    if info:
-                                        processes.append(info)
-                                except:
+                                except psutil.Error:
                                     continue
-                        except Exception as e:
-                            logging.error(f"Alternative process list retrieval failed: {str(e)}")
+                                self._proc_objs[pid] = proc
+                            to_fetch.append((proc, cpu_percent, memory_percent))
+                        
+                        # 每个任务只读写自己PID对应的缓存项，字典单键操作在GIL下是原子的
+                        results = self._executor.map(lambda c: self._get_process_info(*c), to_fetch)
+                        processes.extend(info for info in results if info)
+                    except Exception as e:
+                        logging.error(f"Error getting process list: {str(e)}")
                     
                     # 按CPU使用率排序
                     processes.sort(key=lambda x: x.avg_cpu_percent, reverse=True)
                     
-                    # 更新进程数据
-                    with self.data_lock:
-                        self.process_data = processes
+                    # 更新进程数据（整体替换引用，读取方无需加锁）
+                    self.process_data = processes
                     
                     # 通知监听器
-                    try:
-                        self.update_queue.put(True, block=False)
-                    except queue.Full:
-                        pass
+                    self.update_notifier.set()
                     
-                    logging.debug(f"Full monitor update completed - {len(processes)} processes found")
+                    logging.debug("Full monitor update completed - %d processes found", len(processes))
                 
                 # 休眠直到下一个更新周期
                 time.sleep(self.update_interval)
                 
             except Exception as e:
-                logging.error(f"Error in monitor loop: {str(e)}")
-                logging.debug(traceback.format_exc())
+                logging.error(f"Error in monitor loop: {str(e)}", exc_info=True)
                 time.sleep(self.update_interval)
 
     def _start_monitor_thread(self):
@@ -427,8 +593,7 @@ class CPUMonitorCore:
 
     def get_process_list(self) -> List[ProcessInfo]:
         """获取进程列表"""
-        with self.data_lock:
-            return self.process_data.copy()
+        return list(self.process_data)
 
     def request_update(self):
         """请求立即更新进程信息"""
@@ -437,16 +602,20 @@ class CPUMonitorCore:
 
     def get_system_stats(self) -> Dict:
         """获取系统统计信息"""
-        with self.data_lock:
-            return self.system_data.copy()
+        return self.system_data.copy()
+
+    def peek_latest(self) -> Tuple[int, float, float]:
+        """获取最新样本 (序号, CPU%, 内存%)，序号每次追加历史时递增"""
+        return self._latest_sample
 
     def get_history_data(self) -> Dict:
         """获取历史数据"""
         with self.data_lock:
             return {
-                'cpu': self.history_data['cpu'].copy(),
-                'memory': self.history_data['memory'].copy(),
-                'timestamps': self.history_data['timestamps'].copy()
+                'cpu': list(self.history_data['cpu']),
+                'memory': list(self.history_data['memory']),
+                'timestamps': list(self.history_data['timestamps']),
+                'seq': self._latest_sample[0]
             }
 
     def kill_process(self, pid: int) -> bool:
@@ -456,8 +625,7 @@ class CPUMonitorCore:
             process.terminate()
             
             # 从缓存中移除
-            if pid in self.process_cache:
-                del self.process_cache[pid]
+            self.process_cache.pop(pid, None)
                 
             logging.info(f"Process {pid} terminated successfully")
             return True
@@ -472,12 +640,11 @@ class CPUMonitorCore:
                     os.system(f"taskkill /F /PID {pid}")
                     
                     # 从缓存中移除
-                    if pid in self.process_cache:
-                        del self.process_cache[pid]
+                    self.process_cache.pop(pid, None)
                         
                     logging.info(f"Process {pid} terminated using taskkill")
                     return True
-                except:
+                except OSError:
                     return False
             return False
         except Exception as e:
@@ -499,4 +666,6 @@ class CPUMonitorCore:
         logging.info("Shutting down CPU Monitor Core")
         self.running = False
         if hasattr(self, 'monitor_thread'):
-            self.monitor_thread.join(timeout=2) 
\ No newline at end of file
+            self.monitor_thread.join(timeout=2)
+        if hasattr(self, '_executor'):
+            self._executor.shutdown(wait=False) 
\ No newline at end of file
@@ -7,6 +7,9 @@ from prettytable import PrettyTable
 import threading
 import logging
 
+# ANSI escape: clear screen and move cursor home
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+
 class CPUMonitor:
     def __init__(self, threshold=70):
         """
@@ -16,6 +19,7 @@ class CPUMonitor:
         self.threshold = threshold
         self.running = True
         self.setup_logging()
+        self._prime_cpu_percent()
         
     def setup_logging(self):
         """Setup logging configuration"""
@@ -28,13 +32,25 @@ class CPUMonitor:
             ]
         )
         
+    def _prime_cpu_percent(self):
+        """
+        Take an initial non-blocking CPU sample for every process so that
+        later cpu_percent() calls report usage since the previous refresh
+        """
+        psutil.cpu_percent()
+        for proc in psutil.process_iter():
+            try:
+                proc.cpu_percent()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        
     def get_process_info(self, process):
         """
         Get information about a specific process
         """
         try:
             with process.oneshot():
-                cpu_percent = process.cpu_percent(interval=0.1)
+                cpu_percent = process.cpu_percent()
                 memory_percent = process.memory_percent()
                 name = process.name()
                 pid = process.pid
@@ -60,12 +76,16 @@ class CPUMonitor:
         """
         Monitor and display system processes
         """
+        if os.name == 'nt':
+            # Enable ANSI escape processing in the Windows console
+            os.system('')
+            
         while self.running:
             table = PrettyTable()
             table.field_names = ["Name", "PID", "CPU %", "Memory %", "User", "Status"]
             
             processes = []
-            for proc in psutil.process_iter(['name', 'pid', 'cpu_percent', 'memory_percent', 'username']):
+            for proc in psutil.process_iter():
                 try:
                     info = self.get_process_info(proc)
                     if info:
@@ -87,7 +107,7 @@ class CPUMonitor:
                 table.add_row(proc)
             
             # Clear screen and show updated table
-            os.system('cls' if os.name == 'nt' else 'clear')
+            print(CLEAR_SCREEN, end='')
             print(f"\nCPU Monitor - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"System CPU Usage: {psutil.cpu_percent()}%")
             print(f"Threshold: {self.threshold}%\n")
@@ -1,22 +1,23 @@
 import sys
 import os
 import logging
+import importlib.util
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                           QHBoxLayout, QLabel, QPushButton, QTableWidget,
-                           QTableWidgetItem, QHeaderView, QMessageBox, QSpinBox,
+                           QHBoxLayout, QLabel, QPushButton, QTableView,
+                           QHeaderView, QMessageBox, QSpinBox,
                            QStyle, QStyleFactory, QFrame, QSplitter, QProgressBar,
-                           QCheckBox)
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot, QThread, pyqtSignal
-from PyQt6.QtGui import QPalette, QColor, QFont
-import pyqtgraph as pg
+                           QCheckBox, QStyledItemDelegate, QAbstractItemView)
+from PyQt6.QtCore import (Qt, QTimer, pyqtSlot, QThread, pyqtSignal,
+                          QAbstractTableModel, QModelIndex, QEvent)
+from PyQt6.QtGui import QPalette, QColor, QFont, QBrush
 from datetime import datetime
-import traceback
-import time
-from cpu_core import CPUMonitorCore, ProcessInfo
+from threading import Event
+from typing import NamedTuple, Tuple
+from cpu_core import CPUMonitorCore, ProcessInfo, get_log_level
 
 # 设置日志记录
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=get_log_level(),
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('cpu_monitor_debug.log'),
@@ -24,36 +25,229 @@ logging.basicConfig(
     ]
 )
 
+PID_COLUMN = 1
+STATUS_COLUMN = 6
+STATUS_CODE_ROLE = Qt.ItemDataRole.UserRole + 1  # 行状态码，见_STATUS_LUT
+
+# 状态码 -> (状态文本, 状态列前景, 整行背景)，画刷只在启动时构造一次
+STATUS_NORMAL, STATUS_HIGH = 0, 1
+_STATUS_LUT = (
+    ("Normal", QBrush(QColor("#44ff44")), None),
+    ("HIGH", QBrush(QColor("#ff4444")), QBrush(QColor(40, 0, 0))),
+)
+
+def _status_code(avg_cpu_percent, threshold):
+    return STATUS_HIGH if avg_cpu_percent > threshold else STATUS_NORMAL
+
+class ProcessRow(NamedTuple):
+    """预先格式化好的表格行"""
+    pid: int
+    texts: Tuple[str, ...]  # 各列显示文本
+    avg_cpu_percent: float
+    status_code: int
+
+class ProcessTableModel(QAbstractTableModel):
+    """进程表格数据模型，单元格文本已由工作线程格式化"""
+    HEADERS = ("进程名", "PID", "CPU %", "3分钟平均CPU %", "内存 %", "用户",
+               "状态", "命令行", "启动时间", "线程数")
+    
+    _LEFT = Qt.AlignmentFlag.AlignLeft
+    _RIGHT = Qt.AlignmentFlag.AlignRight
+    # 每列的对齐方式，状态列使用默认对齐
+    _COL_ALIGN = (_LEFT, _RIGHT, _RIGHT, _RIGHT, _RIGHT, _LEFT, None, _LEFT, _LEFT, _RIGHT)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row.texts[col]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._COL_ALIGN[col]
+        if role == STATUS_CODE_ROLE:
+            return row.status_code
+        if role == Qt.ItemDataRole.UserRole and col == PID_COLUMN:
+            return row.pid
+        if role == Qt.ItemDataRole.ForegroundRole and col == STATUS_COLUMN:
+            # 状态列 - 根据平均CPU使用率着色
+            return _STATUS_LUT[row.status_code][1]
+        return None
+    
+    def row_at(self, row):
+        """返回指定行的数据"""
+        return self._rows[row]
+    
+    @staticmethod
+    def _row_runs(rows):
+        """将行号合并为连续区间 [(first, last), ...]"""
+        runs = []
+        for row in sorted(rows):
+            if runs and runs[-1][1] == row - 1:
+                runs[-1][1] = row
+            else:
+                runs.append([row, row])
+        return runs
+    
+    def update_rows(self, rows):
+        """按PID增量更新模型，只通知发生变化的行"""
+        new_rows = {r.pid: i for i, r in enumerate(rows)}
+        old_texts = {r.pid: r.texts for r in self._rows}
+        
+        # 删除已消失的进程，自底向上按连续区间删除避免行号偏移
+        removed = [i for i, r in enumerate(self._rows) if r.pid not in new_rows]
+        for first, last in reversed(self._row_runs(removed)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        
+        # 新出现的进程一次性追加到末尾
+        added = [r for r in rows if r.pid not in old_texts]
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+        
+        # 按新顺序重排，选中项等持久索引跟随PID移动
+        if any(r.pid != q.pid for r, q in zip(self._rows, rows)):
+            self.layoutAboutToBeChanged.emit()
+            old_indexes = self.persistentIndexList()
+            new_indexes = [self.index(new_rows[self._rows[i.row()].pid], i.column())
+                           for i in old_indexes]
+            self._rows = list(rows)
+            self.changePersistentIndexList(old_indexes, new_indexes)
+            self.layoutChanged.emit()
+        else:
+            self._rows = list(rows)
+        
+        # 只通知显示文本发生变化的行
+        changed = [i for i, r in enumerate(rows) if r.pid in old_texts and old_texts[r.pid] != r.texts]
+        last_col = self.columnCount() - 1
+        for first, last in self._row_runs(changed):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_col))
+    
+    def set_threshold(self, threshold):
+        """按新阈值重算状态并重绘受影响的状态列和背景"""
+        rows = []
+        for r in self._rows:
+            code = _status_code(r.avg_cpu_percent, threshold)
+            rows.append(r._replace(texts=r.texts[:STATUS_COLUMN]
+                                   + (_STATUS_LUT[code][0],)
+                                   + r.texts[STATUS_COLUMN + 1:],
+                                   status_code=code))
+        self._rows = rows
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, self.columnCount() - 1),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole, STATUS_CODE_ROLE]
+            )
+
+class ProcessRowDelegate(QStyledItemDelegate):
+    """根据模型的状态码为整行绘制背景"""
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        background = _STATUS_LUT[index.data(STATUS_CODE_ROLE)][2]
+        if background is not None:
+            option.backgroundBrush = background
+
 class ProcessUpdateThread(QThread):
     """进程数据更新线程，避免UI阻塞"""
     update_ready = pyqtSignal(list, dict)
+    refresh_done = pyqtSignal()
     
     def __init__(self, core):
         super().__init__()
         self.core = core
         self.running = True
+        self._active = Event()  # 清除时暂停取数（窗口隐藏或最小化）
+        self._active.set()
+        self._time_str_cache = {}  # {int(create_time): 格式化后的启动时间}
+    
+    def _format_create_time(self, create_time):
+        """格式化进程启动时间，按整数秒缓存strftime结果"""
+        if create_time <= 0:
+            return "N/A"
+        key = int(create_time)
+        time_str = self._time_str_cache.get(key)
+        if time_str is None:
+            if len(self._time_str_cache) > 4096:
+                self._time_str_cache.clear()
+            time_str = datetime.fromtimestamp(key).strftime('%Y-%m-%d %H:%M:%S')
+            self._time_str_cache[key] = time_str
+        return time_str
+    
+    def _format_rows(self, processes):
+        """在工作线程中预先格式化所有单元格文本，UI线程只负责绑定"""
+        threshold = self.core.threshold
+        fmt_time = self._format_create_time
+        rows = []
+        for p in processes:
+            code = _status_code(p.avg_cpu_percent, threshold)
+            rows.append(ProcessRow(
+                p.pid,
+                (p.name, str(p.pid), f"{p.cpu_percent:.1f}", f"{p.avg_cpu_percent:.1f}",
+                 f"{p.memory_percent:.1f}", p.username, _STATUS_LUT[code][0],
+                 p.command, fmt_time(p.create_time), str(p.threads)),
+                p.avg_cpu_percent,
+                code
+            ))
+        return rows
     
     def run(self):
         while self.running:
             try:
-                # 等待更新信号
-                try:
-                    self.core.update_queue.get(timeout=1)
-                except:
-                    continue
+                # 窗口不可见时暂停
+                self._active.wait()
                 
-                # 获取数据
+                # 阻塞等待更新信号，期间多次完整更新只合并为一次取数
+                self.core.update_notifier.wait()
+                if not self.running:
+                    break
+                self.core.update_notifier.clear()
+                
+                # 获取数据并预先格式化
                 processes = self.core.get_process_list()
+                rows = self._format_rows(processes)
                 stats = self.core.get_system_stats()
+                stats['total_threads'] = sum(p.threads for p in processes)
                 
                 # 发送信号到UI线程
-                self.update_ready.emit(processes, stats)
+                self.update_ready.emit(rows, stats)
+                self.refresh_done.emit()
                 
             except Exception as e:
-                logging.error(f"Error in update thread: {str(e)}")
+                logging.error(f"Error in update thread: {str(e)}", exc_info=True)
+    
+    def pause(self):
+        self._active.clear()
+    
+    def resume(self):
+        self._active.set()
     
     def stop(self):
         self.running = False
+        # 唤醒阻塞中的等待，使线程退出
+        self._active.set()
+        self.core.update_notifier.set()
         self.wait()
 
 class CPUMonitorUI(QMainWindow):
@@ -73,11 +267,17 @@ class CPUMonitorUI(QMainWindow):
             self.init_ui()
             
             # 性能相关设置
-            self.last_ui_update = 0
             self.min_update_interval = 1.0  # 最小UI更新间隔（秒）
             self.auto_refresh = True
             self.table_needs_update = False
             
+            # 更新合并：冷却期内只保留最新一份数据，冷却结束时保证绘制一次
+            self._pending = None
+            self._flush_timer = QTimer(self)
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(int(self.min_update_interval * 1000))
+            self._flush_timer.timeout.connect(self._flush_pending)
+            
             logging.info("UI initialization completed")
         except Exception as e:
             logging.error(f"Error during initialization: {str(e)}")
@@ -127,6 +327,17 @@ class CPUMonitorUI(QMainWindow):
             stats_widget.setLayout(stats_layout)
             top_layout.addWidget(stats_widget)
             
+            # pyqtgraph（连带numpy）导入较慢，推迟到创建图表时再加载
+            import pyqtgraph as pg
+            self._pg = pg
+            
+            # 图表全局配置：关闭抗锯齿；OpenGL渲染依赖显卡驱动，通过CPU_MONITOR_OPENGL=1开启；
+            # 安装了numba时启用其加速路径（未安装时开启会触发警告）
+            pg.setConfigOptions(antialias=False,
+                                useOpenGL=os.environ.get('CPU_MONITOR_OPENGL') == '1',
+                                useNumba=importlib.util.find_spec('numba') is not None,
+                                useCupy=False)
+            
             # Graphs
             graphs_widget = QWidget()
             graphs_layout = QHBoxLayout(graphs_widget)
@@ -212,21 +423,19 @@ class CPUMonitorUI(QMainWindow):
             bottom_layout.addWidget(self.process_count_label)
             
             # Process table
-            self.process_table = QTableWidget()
-            self.process_table.setColumnCount(10)  # 增加一列
-            self.process_table.setHorizontalHeaderLabels([
-                "进程名", "PID", "CPU %", "3分钟平均CPU %", "内存 %", "用户",
-                "状态", "命令行", "启动时间", "线程数"
-            ])
+            self.process_model = ProcessTableModel(self)
+            self.process_table = QTableView()
+            self.process_table.setModel(self.process_model)
+            self.process_table.setItemDelegate(ProcessRowDelegate(self.process_table))
             
             # 优化表格性能
-            self.process_table.setRowCount(100)  # 预分配行
             self.process_table.verticalHeader().setVisible(False)  # 隐藏行号
             self.process_table.setShowGrid(False)  # 隐藏网格线
+            self.process_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)  # 整行选择
             
             # 设置列宽
             header = self.process_table.horizontalHeader()
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # 名称
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)  # 名称（固定初始宽度，可手动调整）
             header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)  # PID
             header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)  # CPU
             header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)  # 3分钟平均CPU
@@ -238,6 +447,7 @@ class CPUMonitorUI(QMainWindow):
             header.setSectionResizeMode(9, QHeaderView.ResizeMode.Fixed)  # 线程
             
             # 设置固定宽度的列
+            self.process_table.setColumnWidth(0, 200)  # 名称
             self.process_table.setColumnWidth(1, 60)   # PID
             self.process_table.setColumnWidth(2, 60)   # CPU
             self.process_table.setColumnWidth(3, 100)  # 3分钟平均CPU
@@ -247,9 +457,6 @@ class CPUMonitorUI(QMainWindow):
             self.process_table.setColumnWidth(8, 150)  # 时间
             self.process_table.setColumnWidth(9, 60)   # 线程
             
-            # 允许排序，但默认关闭（按需启用）
-            self.process_table.setSortingEnabled(False)
-            
             bottom_layout.addWidget(self.process_table)
             bottom_widget.setLayout(bottom_layout)
             splitter.addWidget(bottom_widget)
@@ -263,6 +470,17 @@ class CPUMonitorUI(QMainWindow):
             self.cpu_plot_data = self.cpu_graph.plot(pen='r')
             self.memory_plot_data = self.memory_graph.plot(pen='b')
             
+            # float32环形缓冲区，长度为两倍历史点数：每个样本同时写入i和i+N，
+            # 最近N个点始终是一段连续切片，setData无需拼接或类型转换
+            import numpy as np
+            points = self.core.history_max_points
+            self._graph_x = np.arange(points, dtype=np.float32)
+            self._cpu_ring = np.zeros(2 * points, dtype=np.float32)
+            self._memory_ring = np.zeros(2 * points, dtype=np.float32)
+            self._ring_idx = 0
+            self._ring_count = 0
+            self._ring_seq = 0
+            
             # Apply dark theme
             self.apply_dark_theme()
             
@@ -272,8 +490,7 @@ class CPUMonitorUI(QMainWindow):
             logging.info("UI components initialized successfully")
             
         except Exception as e:
-            logging.error(f"Error in init_ui: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.error(f"Error in init_ui: {str(e)}", exc_info=True)
             raise
         
     def _create_stat_card(self, title, value):
@@ -326,7 +543,7 @@ class CPUMonitorUI(QMainWindow):
         
     def _create_graph(self, title):
         try:
-            graph = pg.PlotWidget()
+            graph = self._pg.PlotWidget()
             graph.setBackground('#2d2d2d')
             graph.setTitle(title, color='#888888')
             graph.showGrid(x=True, y=True, alpha=0.3)
@@ -360,7 +577,7 @@ class CPUMonitorUI(QMainWindow):
         
         self.setPalette(dark_palette)
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #2d2d2d;
                 border: none;
             }
@@ -370,7 +587,7 @@ class CPUMonitorUI(QMainWindow):
                 padding: 5px;
                 border: none;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
         """)
@@ -389,27 +606,27 @@ class CPUMonitorUI(QMainWindow):
             self.refresh_button.setEnabled(False)
             self.refresh_button.setText("刷新中...")
             
+            # 自动刷新关闭时也要显示本次手动刷新的结果
+            self.table_needs_update = True
+            
+            # 下一次数据送达后恢复按钮（单次连接，触发后自动断开）
+            self.update_thread.refresh_done.connect(
+                self._restore_refresh_button, Qt.ConnectionType.SingleShotConnection)
+            
             # 请求核心模块立即更新
             self.core.request_update()
             
-            # 启用定时器检查更新是否完成
-            check_timer = QTimer(self)
-            check_timer.timeout.connect(lambda: self._check_refresh_complete(check_timer))
-            check_timer.start(100)  # 每100ms检查一次
-            
         except Exception as e:
             logging.error(f"Force refresh failed: {str(e)}")
             self.statusBar().showMessage(f"刷新失败: {str(e)}", 5000)
             self.refresh_button.setEnabled(True)
             self.refresh_button.setText("刷新进程列表")
     
-    def _check_refresh_complete(self, timer):
-        """检查刷新是否完成"""
-        if self.table_needs_update:
-            timer.stop()
-            self.refresh_button.setEnabled(True)
-            self.refresh_button.setText("刷新进程列表")
-            self.statusBar().showMessage("刷新完成", 3000)
+    def _restore_refresh_button(self):
+        """刷新完成后恢复按钮状态"""
+        self.refresh_button.setEnabled(True)
+        self.refresh_button.setText("刷新进程列表")
+        self.statusBar().showMessage("刷新完成", 3000)
     
     def _on_auto_refresh_changed(self, state):
         """自动刷新状态改变"""
@@ -420,19 +637,25 @@ class CPUMonitorUI(QMainWindow):
             self.statusBar().showMessage("自动刷新已禁用，需手动刷新", 3000)
     
     @pyqtSlot(list, dict)
-    def on_data_update(self, processes, stats):
+    def on_data_update(self, rows, stats):
         """处理来自更新线程的数据更新"""
+        if not self.auto_refresh and not self.table_needs_update:
+            return
+        
+        # 新数据覆盖尚未绘制的旧数据；不在冷却期内则立即绘制
+        self._pending = (rows, stats)
+        if not self._flush_timer.isActive():
+            self._flush_pending()
+    
+    def _flush_pending(self):
+        """绘制最新一份待处理数据并开始冷却计时"""
+        if self._pending is None:
+            return
+        rows, stats = self._pending
+        self._pending = None
+        self._flush_timer.start()
+        
         try:
-            # 检查是否应该更新UI
-            current_time = time.time()
-            if not self.auto_refresh and not self.table_needs_update:
-                return
-                
-            if current_time - self.last_ui_update < self.min_update_interval:
-                # 标记需要更新，但不立即更新
-                self.table_needs_update = True
-                return
-                
             # 更新系统状态卡片
             cpu_percent = stats['cpu_percent']
             memory_percent = stats['memory_percent']
@@ -440,6 +663,7 @@ class CPUMonitorUI(QMainWindow):
             self.cpu_card.value_label.setText(f"{cpu_percent:.1f}%")
             self.memory_card.value_label.setText(f"{memory_percent:.1f}%")
             self.freq_card.value_label.setText(f"{stats['cpu_freq']:.0f} MHz")
+            self.thread_card.value_label.setText(str(stats['total_threads']))
             
             # 更新进度条
             if hasattr(self.cpu_card, 'progress'):
@@ -449,138 +673,87 @@ class CPUMonitorUI(QMainWindow):
                 self.memory_card.progress.setValue(int(memory_percent))
             
             # 更新进程表格
-            self._update_process_table(processes)
+            self._update_process_table(rows)
             
             # 重置更新标志
             self.table_needs_update = False
-            self.last_ui_update = current_time
             
         except Exception as e:
-            logging.error(f"Error handling data update: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.error(f"Error handling data update: {str(e)}", exc_info=True)
     
     def update_graphs(self):
         """仅更新图表，与进程表格分离"""
         try:
-            # 更新图表
-            history = self.core.get_history_data()
-            if history['cpu']:
-                self.cpu_plot_data.setData(history['cpu'])
-            if history['memory']:
-                self.memory_plot_data.setData(history['memory'])
+            seq, cpu_percent, memory_percent = self.core.peek_latest()
+            if seq == self._ring_seq:
+                return
+            
+            if seq == self._ring_seq + 1:
+                self._push_sample(cpu_percent, memory_percent)
+            else:
+                # 首次绘制或漏掉了样本，从核心历史重建环形缓冲区
+                history = self.core.get_history_data()
+                self._ring_idx = 0
+                self._ring_count = 0
+                for cpu, memory in zip(history['cpu'], history['memory']):
+                    self._push_sample(cpu, memory)
+                seq = history['seq']
+            self._ring_seq = seq
+            
+            n = self._ring_count
+            if n:
+                points = len(self._graph_x)
+                end = self._ring_idx + points
+                self.cpu_plot_data.setData(x=self._graph_x[:n], y=self._cpu_ring[end - n:end])
+                self.memory_plot_data.setData(x=self._graph_x[:n], y=self._memory_ring[end - n:end])
                 
         except Exception as e:
-            logging.error(f"Error updating graphs: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.error(f"Error updating graphs: {str(e)}", exc_info=True)
+    
+    def _push_sample(self, cpu_percent, memory_percent):
+        """向环形缓冲区追加一个样本"""
+        points = len(self._graph_x)
+        i = self._ring_idx
+        self._cpu_ring[i] = self._cpu_ring[i + points] = cpu_percent
+        self._memory_ring[i] = self._memory_ring[i + points] = memory_percent
+        self._ring_idx = (i + 1) % points
+        self._ring_count = min(self._ring_count + 1, points)
     
-    def _update_process_table(self, processes):
-        """更新进程表格（优化版本）"""
+    def _update_process_table(self, rows):
+        """更新进程表格（模型/视图版本）"""
         try:
             # 更新进程计数
-            self.process_count_label.setText(f"进程数量: {len(processes)}")
-            
-            # 临时禁用排序以提高性能
-            was_sorting_enabled = self.process_table.isSortingEnabled()
-            self.process_table.setSortingEnabled(False)
-            
-            # 保存当前滚动位置
-            scrollbar = self.process_table.verticalScrollBar()
-            scroll_pos = scrollbar.value()
-            
-            # 清空表格并设置行数
-            self.process_table.clearContents()
-            self.process_table.setRowCount(len(processes))
-            
-            # 批量更新表格内容
-            total_threads = 0
-            for i, proc in enumerate(processes):
-                if i >= len(processes):
-                    break
-                    
-                total_threads += proc.threads
-                self._update_table_row(i, proc)
+            self.process_count_label.setText(f"进程数量: {len(rows)}")
             
-            # 恢复排序
-            self.process_table.setSortingEnabled(was_sorting_enabled)
-            
-            # 恢复滚动位置
-            scrollbar.setValue(scroll_pos)
-            
-            # 更新线程计数
-            self.thread_card.value_label.setText(str(total_threads))
+            # 批量更新期间暂停视图重绘，结束后统一重绘一次
+            self.process_table.setUpdatesEnabled(False)
+            try:
+                # 增量更新模型，滚动位置和选中项保持不变
+                self.process_model.update_rows(rows)
+            finally:
+                self.process_table.setUpdatesEnabled(True)
+                self.process_table.viewport().update()
             
         except Exception as e:
-            logging.error(f"Error updating process table: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.error(f"Error updating process table: {str(e)}", exc_info=True)
     
     def show_error_message(self, title, message):
         QMessageBox.critical(self, title, message)
-            
-    def _update_table_row(self, row, proc):
-        try:
-            def set_item(col, value, align=Qt.AlignmentFlag.AlignLeft):
-                if self.process_table.item(row, col) is None:
-                    item = QTableWidgetItem(str(value))
-                    item.setTextAlignment(align)
-                    self.process_table.setItem(row, col, item)
-                else:
-                    self.process_table.item(row, col).setText(str(value))
-                    self.process_table.item(row, col).setTextAlignment(align)
-                
-            set_item(0, proc.name)
-            set_item(1, proc.pid, Qt.AlignmentFlag.AlignRight)
-            set_item(2, f"{proc.cpu_percent:.1f}", Qt.AlignmentFlag.AlignRight)
-            set_item(3, f"{proc.avg_cpu_percent:.1f}", Qt.AlignmentFlag.AlignRight)
-            set_item(4, f"{proc.memory_percent:.1f}", Qt.AlignmentFlag.AlignRight)
-            set_item(5, proc.username)
-            
-            # 状态列特殊处理 - 根据平均CPU使用率判断
-            status = "HIGH" if proc.avg_cpu_percent > self.core.threshold else "Normal"
-            if self.process_table.item(row, 6) is None:
-                status_item = QTableWidgetItem(status)
-                status_item.setForeground(
-                    QColor("#ff4444") if status == "HIGH" else QColor("#44ff44")
-                )
-                self.process_table.setItem(row, 6, status_item)
-            else:
-                self.process_table.item(row, 6).setText(status)
-                self.process_table.item(row, 6).setForeground(
-                    QColor("#ff4444") if status == "HIGH" else QColor("#44ff44")
-                )
-            
-            set_item(7, proc.command)
-            
-            # 处理创建时间
-            if proc.create_time > 0:
-                time_str = datetime.fromtimestamp(proc.create_time).strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                time_str = "N/A"
-            set_item(8, time_str)
-            
-            set_item(9, proc.threads, Qt.AlignmentFlag.AlignRight)
-            
-            # 根据平均CPU使用率设置行背景色
-            if proc.avg_cpu_percent > self.core.threshold:
-                for col in range(self.process_table.columnCount()):
-                    if self.process_table.item(row, col):
-                        self.process_table.item(row, col).setBackground(QColor(40, 0, 0))
-                        
-        except Exception as e:
-            logging.error(f"Error updating table row {row}: {str(e)}")
-            logging.debug(traceback.format_exc())
         
     def _on_threshold_changed(self, value):
         self.core.set_threshold(value)
+        if hasattr(self, 'process_model'):
+            self.process_model.set_threshold(value)
         
     def _on_kill_process(self):
-        selected_rows = self.process_table.selectedItems()
-        if not selected_rows:
+        # 整行选择时每行只返回一个索引
+        selected = self.process_table.selectionModel().selectedRows(PID_COLUMN)
+        if not selected:
             QMessageBox.warning(self, "警告", "请先选择一个进程")
             return
             
-        row = selected_rows[0].row()
-        pid = int(self.process_table.item(row, 1).text())
-        name = self.process_table.item(row, 0).text()
+        pid = selected[0].data(Qt.ItemDataRole.UserRole)
+        name = selected[0].siblingAtColumn(0).data()
         
         reply = QMessageBox.question(
             self,
@@ -600,6 +773,33 @@ class CPUMonitorUI(QMainWindow):
                 QMessageBox.warning(self, "错误", f"无法终止进程 {pid}")
                 self.statusBar().showMessage(f"无法终止进程 {pid}", 3000)
                 
+    def _set_updates_paused(self, paused):
+        """窗口不可见时停止图表刷新和进程表取数"""
+        if not hasattr(self, 'update_timer'):
+            return
+        if paused:
+            self.update_timer.stop()
+            self.update_thread.pause()
+        elif not self.update_timer.isActive():
+            self.update_thread.resume()
+            self.update_timer.start(1000)
+            # 恢复后立即刷新，避免显示过期数据
+            self.update_graphs()
+            self.core.request_update()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._set_updates_paused(False)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._set_updates_paused(True)
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._set_updates_paused(self.isMinimized())
+    
     def closeEvent(self, event):
         # 停止更新线程
         if hasattr(self, 'update_thread'):
@@ -612,6 +812,9 @@ class CPUMonitorUI(QMainWindow):
         event.accept()
 
 def check_admin():
+    # 启动脚本已确认管理员权限时直接复用结果，省去shell32加载
+    if os.environ.get('CPU_MON_ADMIN') == '1':
+        return True
     try:
         return os.getuid() == 0
     except AttributeError:
@@ -642,8 +845,7 @@ def main():
         
         sys.exit(app.exec())
     except Exception as e:
-        logging.critical(f"Critical error in main: {str(e)}")
-        logging.debug(traceback.format_exc())
+        logging.critical(f"Critical error in main: {str(e)}", exc_info=True)
         QMessageBox.critical(None, "严重错误", f"程序启动失败: {str(e)}")
         sys.exit(1)
 
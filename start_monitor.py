@@ -66,6 +66,8 @@ def main():
             sys.exit(1)
     
     # 以管理员权限运行
+    # 通知主程序权限已确认，避免重复检查
+    os.environ['CPU_MON_ADMIN'] = '1'
     try:
         print("正在启动CPU监控器...")
         